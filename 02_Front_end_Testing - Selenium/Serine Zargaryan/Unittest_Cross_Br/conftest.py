@@ -0,0 +1,119 @@
+import os
+import itertools
+
+import pytest
+
+from test_helpers import WebDriverFactory, WebDriverPool, BlueOriginHelpers, BlueOriginUrls
+
+
+class BrowserSession:
+    """Pooled browser shared by the tests of one class, plus the consent cookies a replacement browser gets back"""
+
+    def __init__(self, browser_name, disable_javascript):
+        self.browser_name = browser_name
+        self.disable_javascript = disable_javascript
+        self.driver = WebDriverPool.get_instance().acquire(browser_name, disable_javascript)
+        self.consent_cookies = []
+
+    def prime_cache(self):
+        """Load the careers pages once so every test's driver.get hits a warm browser cache"""
+        BlueOriginHelpers(self.driver).prime_cache((BlueOriginUrls.CAREERS_URL, BlueOriginUrls.CAREERS_SEARCH_URL))
+
+    def accept_cookie_consent(self):
+        """Accept the cookie banner once; the cookies persist across resets and are restored on a replacement"""
+        # Without JavaScript the banner never renders, so there is nothing to accept
+        if not self.disable_javascript:
+            self.consent_cookies = BlueOriginHelpers(self.driver).accept_cookie_consent()
+
+    def reset(self):
+        """Reset the shared browser before a test, replacing it if its session died"""
+        pool = WebDriverPool.get_instance()
+        if not pool.reset(self.driver):
+            self.driver = pool.acquire(self.browser_name, self.disable_javascript)
+            # The reset keeps cookies, so only a replacement browser needs the consent cookies back
+            BlueOriginHelpers(self.driver).restore_cookies(self.consent_cookies)
+        return self.driver
+
+    def release(self):
+        """Return the shared browser to the pool"""
+        WebDriverPool.get_instance().release(self.driver)
+
+
+def pytest_generate_tests(metafunc):
+    """Run every test that uses browser_name once per browser, sharing one browser per class.
+
+    Limit the run with BROWSERS=chrome,edge or pytest -m browser_chrome; xdist_group keeps each browser's
+    tests on one worker under --dist=loadgroup.
+    """
+    if 'browser_name' in metafunc.fixturenames:
+        metafunc.parametrize("browser_name", [
+            pytest.param(browser, marks=(getattr(pytest.mark, f"browser_{browser}"), pytest.mark.xdist_group(browser)))
+            for browser in WebDriverFactory.selected_browsers()
+        ], scope="class")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(items):
+    """Run each browser's tests in a class cheapest first, by their pytest.mark.cost.
+
+    Cheap smoke tests carry the lowest numbers, so with -x a broken page fails fast instead of after the
+    expensive cross-system searches.
+
+    Runs after pytest has grouped the items per class-scoped browser_name, and only sorts inside those groups,
+    so a browser's shared session is never torn down and set up again between its tests.
+    """
+    def browser_group(item):
+        callspec = getattr(item, 'callspec', None)
+        return item.parent.nodeid, callspec.params.get('browser_name') if callspec else None
+
+    def cost(item):
+        marker = item.get_closest_marker('cost')
+        return marker.args[0] if marker else 0
+
+    items[:] = [item for _, group in itertools.groupby(items, key=browser_group) for item in sorted(group, key=cost)]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def prewarmed_browsers(request):
+    """Launch every browser the session will use in parallel up front, instead of one by one on first use"""
+    # Only without xdist (-n 0): workers each run one browser group (--dist=loadgroup) and only learn which
+    # when its tests arrive, so there each browser launches with its class's first test
+    if os.getenv('PYTEST_XDIST_WORKER'):
+        return
+    browser_names = set()
+    for item in request.session.items:
+        callspec = getattr(item, 'callspec', None)
+        if callspec and 'browser_name' in callspec.params:
+            browser_names.add(callspec.params['browser_name'])
+    WebDriverPool.get_instance().prewarm_in_background(sorted(browser_names))
+
+
+@pytest.fixture(scope="class")
+def disable_javascript():
+    """Whether the class's browser runs with JavaScript disabled; override in a test class to change it"""
+    return False
+
+
+@pytest.fixture(scope="class")
+def browser_session(browser_name, disable_javascript):
+    """Start one browser shared by every test in the class"""
+    session = BrowserSession(browser_name, disable_javascript)
+    try:
+        session.prime_cache()
+        session.accept_cookie_consent()
+        yield session
+    finally:
+        # Also on a failed setup, otherwise the next class for this browser waits in acquire() for the driver
+        session.release()
+
+
+@pytest.fixture
+def driver(browser_session):
+    """The class's shared browser, reset for the current test"""
+    return browser_session.reset()
+
+
+@pytest.fixture
+def helpers(driver):
+    """BlueOriginHelpers bound to the current test's browser"""
+    return BlueOriginHelpers(driver)
@@ -1,136 +1,122 @@
-#import AllureReports
-#import HtmlTestRunner
-import unittest
-import time
-from unittest.case import TestCase
+import pytest
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support import expected_conditions as EC
 
-from test_helpers import WebDriverFactory, BlueOriginHelpers, BlueOriginUrls
+from test_helpers import BlueOriginUrls
 
 
-class BaseBlueOriginTest(TestCase):
-    """Base test class with common setup and teardown"""
+class TestBlueOriginPositive:
+    """Positive scenarios; the class scope lets every test of one browser share its browser_session"""
 
-    browser_name = None  # To be overridden in subclasses
-
-    def setUp(self):
-        """Setup method executed before each test"""
-        if not self.browser_name:
-            raise NotImplementedError("browser_name must be set in subclass")
-
-        self.driver = WebDriverFactory.get_driver(self.browser_name)
-        self.helpers = BlueOriginHelpers(self.driver)
-
-    def tearDown(self):
-        """Teardown method executed after each test"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
-
-    def _test_navigation_back_to_search(self):
+    @pytest.mark.cost(1)
+    def test_tc_p_001_navigation_back_to_search(self, driver, helpers):
         """TC_P_001: Verify navigation back to original search system via job details page"""
         # Step 1: Open careers search page
-        self.driver.get(BlueOriginUrls.CAREERS_SEARCH_URL)
-        self.helpers.handle_cookie_consent()
-        time.sleep(3)  # Increase wait time
+        driver.get(BlueOriginUrls.CAREERS_SEARCH_URL)
 
-        # Step 2: Click the first job listing with specific class
-        first_job = self.helpers.find_first_job_listing()
-        self.assertIsNotNone(first_job, "First job listing not found with any selector")
+        # Step 2: Click the first job listing with specific class (waits for the listings to render)
+        first_job = helpers.find_first_job_listing()
+        assert first_job is not None, "First job listing not found with any selector"
 
-        self.helpers.click_element_safely(first_job)
-        time.sleep(3)
+        search_page_url = driver.current_url
+        helpers.click_element_safely(first_job)
+        helpers.wait_until(EC.url_changes(search_page_url))
 
         # Step 3: Find and click "Search for Jobs" button
-        navigation_success = self.helpers.navigate_to_search_jobs()
-        self.assertTrue(navigation_success, "Search for Jobs button not found")
-        time.sleep(1)  # Wait no more than 1 second
+        navigation_success = helpers.navigate_to_search_jobs()
+        assert navigation_success, "Search for Jobs button not found"
+        # Wait no more than 1 second for the redirect
+        helpers.wait_until(EC.url_to_be(BlueOriginUrls.CAREERS_SEARCH_URL), timeout=1)
 
         # Step 4: Verify the redirected URL
-        current_url = self.driver.current_url
+        current_url = driver.current_url
         expected_url = BlueOriginUrls.CAREERS_SEARCH_URL
 
-        self.assertEqual(current_url, expected_url,
-                        f"Expected exact URL {expected_url}, got: {current_url}")
+        assert current_url == expected_url, f"Expected exact URL {expected_url}, got: {current_url}"
 
-    def _test_keyword_search_functionality(self):
-        """TC_P_002: Verify keyword search functionality"""
+    def _run_keyword_search(self, driver, helpers, keyword):
+        """Open the careers search page, search for keyword and return the results count (shared by TC_P_002/003)"""
         # Step 1: Open careers search page
-        self.driver.get(BlueOriginUrls.CAREERS_SEARCH_URL)
-        self.helpers.handle_cookie_consent()
-        time.sleep(2)
+        driver.get(BlueOriginUrls.CAREERS_SEARCH_URL)
 
-        # Step 2: Find the specific search input and enter "software"
-        search_success = self.helpers.search_for_keyword("software")
-        self.assertTrue(search_success, "Search input field not found")
+        # Step 2: Find the specific search input and enter the keyword
+        search_success = helpers.search_for_keyword(keyword)
+        assert search_success, "Search input field not found"
 
         # Step 3: Check and save results count
-        results_count = self.helpers.get_search_results_count()
-        self.assertGreater(results_count, 0, f"No search results found. Count: {results_count}")
+        results_count = helpers.get_search_results_count()
+        assert results_count > 0, f"No search results found. Count: {results_count}"
+        return results_count
+
+    def _open_job_details(self, driver, helpers, job_listing):
+        """Click a job listing and wait for its details page"""
+        results_url = driver.current_url
+        helpers.click_element_safely(job_listing)
+        helpers.wait_until(EC.url_changes(results_url))
+
+    @pytest.mark.cost(4)
+    def test_tc_p_002_keyword_search_functionality(self, driver, helpers):
+        """TC_P_002: Verify keyword search functionality"""
+        self._run_keyword_search(driver, helpers, "software")
 
         # Step 4: Check relevance of first 5 results
-        relevant_count, job_listings = self.helpers.check_keyword_relevance_in_results("software", 5)
-        self.assertGreater(relevant_count, 0,
-                          f"No 'software' keyword found in top 5 results. Relevant count: {relevant_count}")
+        relevant_count, job_listings = helpers.check_keyword_relevance_in_results("software", 5)
+        assert relevant_count > 0, \
+            f"No 'software' keyword found in top 5 results. Relevant count: {relevant_count}"
 
-        # Click on first result for next test
+        # Click on first result
         if job_listings:
-            self.helpers.click_element_safely(job_listings[0])
-            time.sleep(2)
+            self._open_job_details(driver, helpers, job_listings[0])
 
-    def _test_search_results_consistency(self):
+    @pytest.mark.cost(5)
+    def test_tc_p_003_search_results_consistency(self, driver, helpers):
         """TC_P_003: Verify consistency of search results across systems"""
-        # First, run the search from TC_P_002 to get baseline
-        self._test_keyword_search_functionality()
+        # First, run the same search as TC_P_002 to get the baseline count (its relevance check is not repeated)
+        original_count = self._run_keyword_search(driver, helpers, "software")
+
+        # Open a job details page from the search results
+        first_job = helpers.find_first_job_listing()
+        assert first_job is not None, "First job listing not found with any selector"
+        self._open_job_details(driver, helpers, first_job)
 
-        # Now we're on a job details page after clicking on a job from search results
         # Find and click either "Search for Jobs" button or logo link
-        navigation_success = self.helpers.navigate_to_search_jobs()
-        self.assertTrue(navigation_success, "Neither Search for Jobs button nor logo link found")
-        time.sleep(2)
+        navigation_success = helpers.navigate_to_search_jobs()
+        assert navigation_success, "Neither Search for Jobs button nor logo link found"
 
-        # Enter "software" in the search input
-        search_success = self.helpers.search_with_new_system("software")
-        self.assertTrue(search_success, "Keyword search input not found")
+        # Enter "software" in the search input (waits for the input to appear)
+        search_success = helpers.search_with_new_system("software")
+        assert search_success, "Keyword search input not found"
 
         # Get results count from the new system
-        new_results_count = self.helpers.get_new_system_results_count()
-        self.assertGreater(new_results_count, 0, "Job found text element not found")
+        new_results_count = helpers.get_new_system_results_count()
+        assert new_results_count > 0, "Job found text element not found"
 
         # Compare results
-        original_count = self.helpers.search_results_count
-
         print(f"Original search results count (TC_P_002): {original_count}")
         print(f"New search results count (TC_P_003): {new_results_count}")
 
         # Check if results match
-        self.assertEqual(original_count, new_results_count,
-                        f"Results count mismatch: {original_count} vs {new_results_count}")
+        assert original_count == new_results_count, \
+            f"Results count mismatch: {original_count} vs {new_results_count}"
 
-    def _test_blue_origin_career_button_navigation(self):
+    @pytest.mark.cost(2)
+    def test_tc_p_004_blue_origin_career_button_navigation(self, driver, helpers):
         """TC_P_004: Verify navigation behavior of "Blue Origin Career" logo button"""
         # Step 1: Open careers search page
-        self.driver.get(BlueOriginUrls.CAREERS_SEARCH_URL)
+        driver.get(BlueOriginUrls.CAREERS_SEARCH_URL)
 
-        # Handle cookie consent with improved error handling
-        try:
-            self.helpers.handle_cookie_consent()
-        except Exception as e:
-            print(f"Cookie consent handling failed, but continuing test: {e}")
-
-        time.sleep(3)  # Increase wait time
-
-        # Step 2: Locate the specific Blue Origin Career logo in header
-        header_logo = self.helpers.find_header_logo()
-        self.assertIsNotNone(header_logo, "Blue Origin Career header logo not found")
+        # Step 2: Locate the specific Blue Origin Career logo in header (polls until it renders)
+        header_logo = helpers.find_header_logo()
+        assert header_logo is not None, "Blue Origin Career header logo not found"
 
         # Step 3: Click the header logo
-        current_url_before = self.driver.current_url
-        self.helpers.click_element_safely(header_logo)
-        time.sleep(3)
+        current_url_before = driver.current_url
+        helpers.click_element_safely(header_logo)
+        helpers.wait_until(EC.url_changes(current_url_before))
 
         # Step 4: Verify navigation behavior
-        current_url_after = self.driver.current_url
+        current_url_after = driver.current_url
 
         # The logo should navigate to the home page, not necessarily careers
         expected_patterns = [
@@ -139,166 +125,57 @@ class BaseBlueOriginTest(TestCase):
         ]
 
         url_matches = any(pattern in current_url_after for pattern in expected_patterns)
-        self.assertTrue(url_matches, f"Expected navigation to Blue Origin home page, got: {current_url_after}")
+        assert url_matches, f"Expected navigation to Blue Origin home page, got: {current_url_after}"
 
         # Verify URL changed from the search page
-        self.assertNotEqual(current_url_after, current_url_before,
-                           f"URL did not change after clicking logo. Still on: {current_url_after}")
+        assert current_url_after != current_url_before, \
+            f"URL did not change after clicking logo. Still on: {current_url_after}"
 
         # Ensure we're not on search page anymore
-        self.assertNotIn("/search", current_url_after,
-                        f"Should not be on search page after clicking logo, got: {current_url_after}")
+        assert "/search" not in current_url_after, \
+            f"Should not be on search page after clicking logo, got: {current_url_after}"
 
         # Step 5: Verify we're on a valid Blue Origin page
-        content_found = self.helpers.verify_blue_origin_content()
-        self.assertTrue(content_found,
-                       f"Blue Origin content not found on target page. URL: {current_url_after}, "
-                       f"Page title: {self.driver.title}")
+        content_found = helpers.verify_blue_origin_content()
+        assert content_found, (f"Blue Origin content not found on target page. URL: {current_url_after}, "
+                               f"Page title: {driver.title}")
 
-    def _test_keyboard_accessibility(self):
+    @pytest.mark.cost(3)
+    def test_tc_p_005_keyboard_accessibility(self, driver, helpers):
         """TC_P_005: Verify keyboard accessibility to job search"""
         # Step 1: Open careers page (no mouse use)
-        self.driver.get(BlueOriginUrls.CAREERS_URL)
-        self.helpers.handle_cookie_consent()
-        time.sleep(2)
+        driver.get(BlueOriginUrls.CAREERS_URL)
 
-        # Step 2: Use Tab key to focus page elements and find "Search Jobs" link/button
-        search_job_found = self.helpers.navigate_with_keyboard(max_tabs=20)
-        self.assertTrue(search_job_found, "Search Jobs link not found via keyboard navigation")
+        # Step 2: Use Tab key to focus page elements and find "Search Jobs" link/button,
+        # retrying until the page has rendered it
+        search_job_found = helpers.wait_until(lambda driver: helpers.navigate_with_keyboard(max_tabs=20))
+        assert search_job_found, "Search Jobs link not found via keyboard navigation"
 
         # Step 4: Press Enter to activate
-        current_url_before = self.driver.current_url
-        actions = ActionChains(self.driver)
+        current_url_before = driver.current_url
+        actions = ActionChains(driver)
         actions.send_keys(Keys.RETURN).perform()
-        time.sleep(3)
+        helpers.wait_until(EC.url_contains("search"))
 
         # Step 5: Verify transition to job search page
-        current_url_after = self.driver.current_url
-        self.assertNotEqual(current_url_after, current_url_before, "URL did not change after pressing Enter")
-        self.assertIn("search", current_url_after, f"Expected 'search' in URL, got: {current_url_after}")
+        current_url_after = driver.current_url
+        assert current_url_after != current_url_before, "URL did not change after pressing Enter"
+        assert "search" in current_url_after, f"Expected 'search' in URL, got: {current_url_after}"
 
         # Step 6: Confirm keyboard usability on new page
-        search_input_found = self.helpers.find_search_input_with_keyboard(max_tabs=10)
-        self.assertTrue(search_input_found, "Search input field not accessible via keyboard")
+        search_input_found = helpers.wait_until(
+            lambda driver: helpers.find_search_input_with_keyboard(max_tabs=10))
+        assert search_input_found, "Search input field not accessible via keyboard"
 
         # Test typing in search field
         actions.send_keys("test").perform()
-        time.sleep(1)
-
-        focused_element = self.driver.switch_to.active_element
-        self.assertIn("test", focused_element.get_attribute("value"),
-                     "Keyboard input not working in search field")
-
-
-# Chrome Tests
-class ChromeBlueOriginTests(BaseBlueOriginTest):
-    """Test class for Chrome browser"""
-    browser_name = 'chrome'
-
-    def test_tc_p_001_navigation_back_to_search(self):
-        """TC_P_001: Verify navigation back to original search system via job details page - Chrome"""
-        self._test_navigation_back_to_search()
-
-    def test_tc_p_002_keyword_search_functionality(self):
-        """TC_P_002: Verify keyword search functionality - Chrome"""
-        self._test_keyword_search_functionality()
-
-    def test_tc_p_003_search_results_consistency(self):
-        """TC_P_003: Verify consistency of search results across systems - Chrome"""
-        self._test_search_results_consistency()
-
-    def test_tc_p_004_blue_origin_career_button_navigation(self):
-        """TC_P_004: Verify navigation behavior of "Blue Origin Career" logo button - Chrome"""
-        self._test_blue_origin_career_button_navigation()
-
-    def test_tc_p_005_keyboard_accessibility(self):
-        """TC_P_005: Verify keyboard accessibility to job search - Chrome"""
-        self._test_keyboard_accessibility()
-
-
-# Firefox Tests
-class FirefoxBlueOriginTests(BaseBlueOriginTest):
-    """Test class for Firefox browser"""
-    browser_name = 'firefox'
-
-    def test_tc_p_001_navigation_back_to_search(self):
-        """TC_P_001: Verify navigation back to original search system via job details page - Firefox"""
-        self._test_navigation_back_to_search()
-
-    def test_tc_p_002_keyword_search_functionality(self):
-        """TC_P_002: Verify keyword search functionality - Firefox"""
-        self._test_keyword_search_functionality()
-
-    def test_tc_p_003_search_results_consistency(self):
-        """TC_P_003: Verify consistency of search results across systems - Firefox"""
-        self._test_search_results_consistency()
-
-    def test_tc_p_004_blue_origin_career_button_navigation(self):
-        """TC_P_004: Verify navigation behavior of "Blue Origin Career" logo button - Firefox"""
-        self._test_blue_origin_career_button_navigation()
-
-    def test_tc_p_005_keyboard_accessibility(self):
-        """TC_P_005: Verify keyboard accessibility to job search - Firefox"""
-        self._test_keyboard_accessibility()
-
-
-# Edge Tests
-class EdgeBlueOriginTests(BaseBlueOriginTest):
-    """Test class for Edge browser"""
-    browser_name = 'edge'
-
-    def test_tc_p_001_navigation_back_to_search(self):
-        """TC_P_001: Verify navigation back to original search system via job details page - Edge"""
-        self._test_navigation_back_to_search()
-
-    def test_tc_p_002_keyword_search_functionality(self):
-        """TC_P_002: Verify keyword search functionality - Edge"""
-        self._test_keyword_search_functionality()
-
-    def test_tc_p_003_search_results_consistency(self):
-        """TC_P_003: Verify consistency of search results across systems - Edge"""
-        self._test_search_results_consistency()
-
-    def test_tc_p_004_blue_origin_career_button_navigation(self):
-        """TC_P_004: Verify navigation behavior of "Blue Origin Career" logo button - Edge"""
-        self._test_blue_origin_career_button_navigation()
+        helpers.wait_until(
+            lambda driver: "test" in (driver.switch_to.active_element.get_attribute("value") or ""), timeout=2)
 
-    def test_tc_p_005_keyboard_accessibility(self):
-        """TC_P_005: Verify keyboard accessibility to job search - Edge"""
-        self._test_keyboard_accessibility()
+        focused_element = driver.switch_to.active_element
+        assert "test" in focused_element.get_attribute("value"), "Keyboard input not working in search field"
 
 
+# Run the three browsers in parallel worker processes (requires pytest-xdist)
 if __name__ == '__main__':
-     # 1. Create a TestLoader instance to find tests
-      loader = unittest.TestLoader()
-#
-#     # 2. Create a TestSuite to hold all the tests you want to run
-#     suite = unittest.TestSuite()
-#
-#     # 3. Add tests from each browser-specific class to the suite.
-#     # This makes it easy to run tests for a single browser during development.
-#     print("Loading Chrome tests...")
-#     suite.addTests(loader.loadTestsFromTestCase(ChromeBlueOriginTests))
-#
-#     print("Loading Firefox tests...")
-#     suite.addTests(loader.loadTestsFromTestCase(FirefoxBlueOriginTests))
-#
-#     print("Loading Edge tests...")
-#     suite.addTests(loader.loadTestsFromTestCase(EdgeBlueOriginTests))
-#
-#     # 4. Configure the HTMLTestRunner with a descriptive title and description
-#     runner = HtmlTestRunner.HTMLTestRunner(
-#         output='./HtmlReports',
-#         report_name='Positive_Test_Report',  # You can customize the name
-#         report_title='Blue Origin Positive Test Report',
-#         descriptions='Cross-browser positive test scenario execution.'
-#     )
-#
-#     # 5. Run the suite with the configured runner
-#     print("\nStarting positive test run...")
-#     runner.run(suite)
-#     print("Test run complete. Report generated in ./HtmlReports")
-
-    #allure report runner
-# if __name__ == "__main__":
-#         unittest.main(AllureReports)
+    pytest.main([__file__, "-n", "3", "--dist=loadgroup"])